@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+🎣 Helius Webhook Setup - Cerberus Phoenix v2.0
+
+Creates and manages Helius enhanced webhooks for real-time token event
+processing. Webhook CRUD calls run concurrently over a shared aiohttp
+session, rate-limited by a token bucket matching the Helius API limits.
+
+Usage:
+    export HELIUS_API_KEY=your_helius_api_key
+    export HELIUS_AUTH_TOKEN=your_secure_webhook_token
+    export WEBHOOK_BASE_URL=https://your-domain.com
+    ./scripts/setup-helius-webhooks.py [--yes]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
+
+logger = logging.getLogger("helius-setup")
+
+HELIUS_API_BASE = "https://api.helius.xyz/v0"
+
+# Published Helius API rate limit, enforced with a token bucket so
+# legitimate burst headroom is actually used instead of fixed sleeps.
+HELIUS_MAX_RATE = 10  # requests
+HELIUS_RATE_PERIOD = 1.0  # per second
+
+# Endpoint validation hits user-facing domains; just bound in-flight requests.
+MAX_CONCURRENT_REQUESTS = 4
+
+# Transient statuses worth retrying with exponential backoff.
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0  # cap on server-supplied Retry-After
+
+# Request bodies are serialized with orjson instead of aiohttp's stdlib
+# json, so the content type has to be set explicitly.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+WEBHOOK_IDS_FILE = Path(__file__).resolve().parent.parent / "config" / "helius-webhook-ids.json"
+
+# Program IDs monitored by Cerberus Phoenix (see docs/HELIUS_WEBHOOK_INTEGRATION.md)
+PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+SPL_TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGKLQ7d1gQ3XJQsKj1X1g8qj"
+SYSTEM_PROGRAM = "11111111111111111111111111111112"
+RAYDIUM_AMM_PROGRAM = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
+JUPITER_PROGRAM = "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4"
+
+
+@dataclass(frozen=True, slots=True)
+class WebhookConfig:
+    """Configuration for a single Helius enhanced webhook.
+
+    Frozen and slotted: instances are immutable values built once per
+    run, and skipping the per-instance ``__dict__`` keeps them cheap if
+    configs are ever generated per token instead of per program group.
+    """
+    name: str
+    webhook_url: str
+    transaction_types: Tuple[str, ...]
+    account_addresses: Tuple[str, ...]
+    webhook_type: str = "enhanced"
+
+
+class HeliusWebhookManager:
+    """🎣 Manages Helius webhook CRUD over a shared aiohttp session.
+
+    All HTTP methods are coroutines and safe to schedule concurrently
+    with ``asyncio.gather``: Helius API calls go through a token-bucket
+    rate limiter matching the published limits, and validation calls are
+    bounded by a semaphore.
+    """
+
+    def __init__(self, api_key: str, auth_token: str):
+        self.api_key = api_key
+        self.auth_token = auth_token
+        self.base_url = f"{HELIUS_API_BASE}/webhooks"
+        self.limiter = AsyncLimiter(max_rate=HELIUS_MAX_RATE, time_period=HELIUS_RATE_PERIOD)
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.validate_session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "HeliusWebhookManager":
+        # Both sessions keep their connections pooled so repeated calls
+        # reuse sockets instead of redoing the TCP + TLS handshake.
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30),
+            headers={
+                "Authorization": f"Bearer {self.auth_token}",
+                "Connection": "keep-alive",
+            },
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        # Validation hits user-facing domains, not the Helius API, so it
+        # gets its own session without the bearer Authorization header.
+        self.validate_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30),
+            headers={"Connection": "keep-alive"},
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.session.close()
+        await self.validate_session.close()
+
+    def _api_url(self, path: str = "") -> str:
+        return f"{self.base_url}{path}?api-key={self.api_key}"
+
+    async def create_webhook(self, config: WebhookConfig) -> Optional[str]:
+        """Create a single webhook; returns the Helius webhook ID on success."""
+        payload = {
+            "webhookURL": config.webhook_url,
+            "transactionTypes": config.transaction_types,
+            "accountAddresses": config.account_addresses,
+            "webhookType": config.webhook_type,
+            "authHeader": f"Bearer {self.auth_token}",
+        }
+        body_bytes = orjson.dumps(payload)
+        for attempt in range(MAX_RETRIES):
+            async with self.limiter:
+                async with self.session.post(
+                    self._api_url(), data=body_bytes, headers=JSON_HEADERS
+                ) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        webhook_id = data.get("webhookID")
+                        logger.info(f"✅ Created webhook '{config.name}': {webhook_id}")
+                        return webhook_id
+                    if response.status in RETRY_STATUS_CODES and attempt < MAX_RETRIES - 1:
+                        # Only read the delay here; the sleep happens after
+                        # the response context exits so the pooled connection
+                        # is released for the duration of the backoff.
+                        status = response.status
+                        delay = self._retry_delay(response, attempt)
+                    else:
+                        body = await response.text()
+                        logger.info(f"❌ Failed to create webhook '{config.name}': "
+                                    f"HTTP {response.status} - {body}")
+                        return None
+            logger.info(f"⚠️  HTTP {status} creating '{config.name}', "
+                        f"retrying in {delay:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})")
+            await asyncio.sleep(delay)
+        return None
+
+    @staticmethod
+    def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Backoff delay for a retryable response, honoring Retry-After."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_DELAY)
+            except ValueError:
+                pass
+        # Exponential backoff with a little jitter to avoid thundering herd.
+        return (2 ** attempt) * RETRY_BASE_DELAY + random.random() * 0.1
+
+    async def list_webhooks(self) -> List[Dict]:
+        """Return all webhooks registered for this API key."""
+        async with self.limiter:
+            async with self.session.get(self._api_url()) as response:
+                if response.status == 200:
+                    return orjson.loads(await response.read())
+                logger.info(f"❌ Failed to list webhooks: HTTP {response.status}")
+                return []
+
+    async def update_webhook(self, webhook_id: str, config: WebhookConfig) -> bool:
+        """Update an existing webhook in place (one request vs delete+create)."""
+        payload = {
+            "webhookURL": config.webhook_url,
+            "transactionTypes": config.transaction_types,
+            "accountAddresses": config.account_addresses,
+            "webhookType": config.webhook_type,
+            "authHeader": f"Bearer {self.auth_token}",
+        }
+        async with self.limiter:
+            async with self.session.put(
+                self._api_url(f"/{webhook_id}"), data=orjson.dumps(payload), headers=JSON_HEADERS
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"🔄 Updated webhook '{config.name}': {webhook_id}")
+                    return True
+                body = await response.text()
+                logger.info(f"❌ Failed to update webhook '{config.name}': "
+                            f"HTTP {response.status} - {body}")
+                return False
+
+    async def delete_webhook(self, webhook_id: str) -> bool:
+        """Delete a webhook by ID."""
+        async with self.limiter:
+            async with self.session.delete(self._api_url(f"/{webhook_id}")) as response:
+                if response.status == 200:
+                    logger.info(f"🗑️  Deleted webhook {webhook_id}")
+                    return True
+                logger.info(f"❌ Failed to delete webhook {webhook_id}: HTTP {response.status}")
+                return False
+
+    async def validate_webhook_url(self, webhook_url: str) -> bool:
+        """Check that a webhook endpoint is reachable before registering it."""
+        async with self.semaphore:
+            try:
+                async with self.validate_session.get(
+                    webhook_url, timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    reachable = response.status < 500
+            # Timeouts raise asyncio.TimeoutError, not a ClientError; a
+            # hanging endpoint should log as unreachable, not crash the
+            # gathered validation fan-out.
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.info(f"⚠️  Webhook URL {webhook_url} unreachable: {e}")
+                return False
+        if reachable:
+            logger.info(f"✅ Webhook URL reachable: {webhook_url}")
+        else:
+            logger.info(f"⚠️  Webhook URL returned server error: {webhook_url}")
+        return reachable
+
+
+# (program label, program ID, transaction types to subscribe to)
+MONITORED_PROGRAMS = [
+    ("pump.fun", PUMP_FUN_PROGRAM, ("TOKEN_MINT", "SWAP")),
+    ("SPL Token", SPL_TOKEN_PROGRAM, ("TRANSFER",)),
+    ("System Program", SYSTEM_PROGRAM, ("TRANSFER",)),
+    ("Raydium AMM", RAYDIUM_AMM_PROGRAM, ("SWAP",)),
+    ("Jupiter", JUPITER_PROGRAM, ("SWAP",)),
+]
+
+
+# MONITORED_PROGRAMS is fixed, so the configs for a given base URL never
+# change within a run; memoize per base URL instead of rebuilding.
+_CONFIGS_CACHE: Dict[str, Tuple[WebhookConfig, ...]] = {}
+
+
+def get_webhook_configs(base_webhook_url: str) -> Tuple[WebhookConfig, ...]:
+    """Build webhook configurations, one per transaction-type group.
+
+    A Helius enhanced webhook accepts up to 100k account addresses, so
+    programs subscribing to the same transaction types are collapsed
+    into a single webhook instead of one per program. The receiving
+    server dispatches on the sub-path, which is derived from the
+    transaction-type group. Results are cached per base URL.
+    """
+    cached = _CONFIGS_CACHE.get(base_webhook_url)
+    if cached is not None:
+        return cached
+
+    groups: Dict[Tuple[str, ...], List[str]] = {}
+    for _, program_id, transaction_types in MONITORED_PROGRAMS:
+        groups.setdefault(transaction_types, []).append(program_id)
+
+    configs = []
+    for transaction_types, program_ids in groups.items():
+        slug = "-".join(t.lower().replace("_", "-") for t in transaction_types)
+        configs.append(WebhookConfig(
+            name=slug,
+            webhook_url=f"{base_webhook_url}/webhooks/helius/{slug}",
+            transaction_types=transaction_types,
+            account_addresses=tuple(program_ids),
+        ))
+    _CONFIGS_CACHE[base_webhook_url] = tuple(configs)
+    return _CONFIGS_CACHE[base_webhook_url]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Set up Helius webhooks for Cerberus Phoenix")
+    parser.add_argument(
+        "--yes", "--non-interactive",
+        action="store_true",
+        dest="yes",
+        help="skip confirmation prompts (for CI/CD pipelines)",
+    )
+    return parser.parse_args()
+
+
+async def confirm(prompt: str, assume_yes: bool) -> bool:
+    """Ask for confirmation without blocking the event loop.
+
+    input() runs in a worker thread so gathered tasks keep making
+    progress while the prompt waits; --yes skips it entirely.
+    """
+    if assume_yes:
+        return True
+    response = await asyncio.to_thread(input, prompt)
+    return response.strip().lower() == "y"
+
+
+def config_matches_webhook(config: WebhookConfig, webhook: Dict) -> bool:
+    """True when a registered webhook already covers this configuration."""
+    return (
+        set(webhook.get("accountAddresses", [])) == set(config.account_addresses)
+        and set(webhook.get("transactionTypes", [])) == set(config.transaction_types)
+    )
+
+
+async def main(args: argparse.Namespace) -> int:
+    logger.info("🎣 Cerberus Phoenix v2.0 - Helius Webhook Setup")
+    logger.info("=" * 50)
+
+    api_key = os.environ.get("HELIUS_API_KEY")
+    auth_token = os.environ.get("HELIUS_AUTH_TOKEN")
+    base_webhook_url = os.environ.get("WEBHOOK_BASE_URL")
+    if not api_key or not auth_token or not base_webhook_url:
+        logger.info("❌ HELIUS_API_KEY, HELIUS_AUTH_TOKEN and WEBHOOK_BASE_URL must be set")
+        return 1
+
+    webhook_configs = get_webhook_configs(base_webhook_url)
+
+    async with HeliusWebhookManager(api_key, auth_token) as manager:
+        # Validate all endpoints concurrently before touching the Helius API.
+        logger.info(f"\n🔍 Validating {len(webhook_configs)} webhook endpoints...")
+        validations = await asyncio.gather(
+            *[manager.validate_webhook_url(c.webhook_url) for c in webhook_configs]
+        )
+        if not all(validations):
+            logger.info("⚠️  Some webhook endpoints are unreachable")
+            if not await confirm("Proceed with webhook creation anyway? (y/N): ", args.yes):
+                logger.info("🛑 Aborted")
+                return 1
+
+        # Reconcile against what Helius already has so reruns are idempotent:
+        # identical webhooks are skipped, drifted ones are updated in place
+        # (one request instead of delete+create), and only missing ones are
+        # created.
+        existing_webhooks = await manager.list_webhooks()
+        existing_by_url = {w.get("webhookURL"): w for w in existing_webhooks}
+
+        unchanged, to_update, to_create = [], [], []
+        for config in webhook_configs:
+            existing = existing_by_url.get(config.webhook_url)
+            if existing is None:
+                to_create.append(config)
+            elif config_matches_webhook(config, existing):
+                unchanged.append(config)
+            else:
+                to_update.append(config)
+
+        logger.info(f"\n📋 Webhook sync plan: {len(unchanged)} unchanged, "
+                    f"{len(to_update)} to update, {len(to_create)} to create")
+        for config in unchanged:
+            logger.info(f"   ⏭️  '{config.name}' already up to date, skipping")
+
+        if not to_update and not to_create:
+            logger.info("✅ All webhooks already configured, nothing to do")
+        else:
+            if not await confirm("Proceed with webhook sync? (y/N): ", args.yes):
+                logger.info("🛑 Aborted")
+                return 1
+
+        # Fan out the remaining calls; the manager's semaphore bounds
+        # concurrency, so N round trips collapse to roughly one.
+        update_results = await asyncio.gather(*[
+            manager.update_webhook(existing_by_url[c.webhook_url]["webhookID"], c)
+            for c in to_update
+        ])
+        webhook_ids = await asyncio.gather(
+            *[manager.create_webhook(c) for c in to_create]
+        )
+
+    created_webhooks = [
+        {"name": config.name, "webhook_id": webhook_id, "url": config.webhook_url}
+        for config, webhook_id in zip(to_create, webhook_ids)
+        if webhook_id is not None
+    ] + [
+        {
+            "name": config.name,
+            "webhook_id": existing_by_url[config.webhook_url]["webhookID"],
+            "url": config.webhook_url,
+        }
+        for config in unchanged + to_update
+    ]
+
+    WEBHOOK_IDS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # Binary mode with a 64 KiB buffer: orjson emits bytes directly, so
+    # this skips the str->bytes transcoding stdlib json would force.
+    with open(WEBHOOK_IDS_FILE, "wb", buffering=1 << 16) as f:
+        f.write(orjson.dumps(created_webhooks, option=orjson.OPT_INDENT_2))
+
+    logger.info(f"\n✅ {len(created_webhooks)}/{len(webhook_configs)} webhooks active")
+    logger.info(f"💾 Webhook IDs saved to {WEBHOOK_IDS_FILE}")
+    ok = len(created_webhooks) == len(webhook_configs) and all(update_results)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.exit(asyncio.run(main(parse_args())))